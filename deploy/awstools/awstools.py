@@ -18,7 +18,7 @@ from botocore import exceptions
 from fabric.api import local, hide, settings  # type: ignore
 
 # imports needed for python type checking
-from typing import Any, Dict, Optional, List, Sequence, cast
+from typing import Any, Dict, Iterator, Optional, List, Sequence, cast
 from mypy_boto3_ec2.service_resource import Instance as EC2InstanceResource
 from mypy_boto3_ec2.type_defs import FilterTypeDef
 from mypy_boto3_s3.literals import BucketLocationConstraintType
@@ -839,25 +839,71 @@ def wait_on_instance_launches(
         rootLogger.info(str(instance.id) + " booted!")
 
 
+# EC2 accepts up to 1000 ids per request, but smaller batches keep a single
+# bad id from failing a large termination wholesale
+TERMINATE_INSTANCES_BATCH_SIZE = 200
+
+
+def _chunks(seq: List[str], n: int) -> Iterator[List[str]]:
+    """Yield successive n-sized slices of seq."""
+    for i in range(0, len(seq), n):
+        yield seq[i : i + n]
+
+
 def terminate_instances(instanceids: List[str], dryrun: bool = True) -> None:
     """Terminate instances when given a list of instance ids.  for safety,
-    this supplies dryrun=True by default."""
+    this supplies dryrun=True by default.
+
+    Requests are issued in batches of TERMINATE_INSTANCES_BATCH_SIZE ids. A
+    failed batch does not prevent the remaining batches from being
+    terminated. Every failed batch is logged as a warning, and the first
+    failure is re-raised once all batches are tried."""
+    # callers may gather ids from overlapping queries, so drop duplicates
+    # (keeping order) to avoid terminating the same instance twice
+    uniqueinstanceids = list(dict.fromkeys(instanceids))
+    if not uniqueinstanceids:
+        # nothing to do, so skip constructing the ec2 client
+        return
+
     client = boto3.client("ec2")
-    response = client.describe_instances(
-        InstanceIds=instanceids,
-        # Get only pending (0), running (16), stopping (64) or stopped (80) instances
-        Filters=[{"Name": "instance-state-code", "Values": ["0", "16", "64", "80"]}],
-    )
-    runninginstanceids = [
-        i["InstanceId"]
-        for i in chain(
-            *chain(
-                [reservation["Instances"] for reservation in response["Reservations"]]
+    failures: List[Exception] = []
+    num_batches = 0
+    for batch in _chunks(uniqueinstanceids, TERMINATE_INSTANCES_BATCH_SIZE):
+        num_batches += 1
+        try:
+            response = client.describe_instances(
+                InstanceIds=batch,
+                # Get only pending (0), running (16), stopping (64) or stopped (80) instances
+                Filters=[
+                    {"Name": "instance-state-code", "Values": ["0", "16", "64", "80"]}
+                ],
             )
+            runninginstanceids = [
+                i["InstanceId"]
+                for i in chain(
+                    *chain(
+                        [
+                            reservation["Instances"]
+                            for reservation in response["Reservations"]
+                        ]
+                    )
+                )
+            ]
+            if runninginstanceids:
+                client.terminate_instances(
+                    InstanceIds=runninginstanceids, DryRun=dryrun
+                )
+        except client.exceptions.ClientError as e:
+            rootLogger.warning(
+                f"Failed to terminate instance batch {batch}. These instances may still be running: {e}"
+            )
+            failures.append(e)
+
+    if failures:
+        rootLogger.critical(
+            f"{len(failures)} of {num_batches} instance termination batches failed. See the warnings above for the instance ids that may still be running."
         )
-    ]
-    if runninginstanceids:
-        client.terminate_instances(InstanceIds=runninginstanceids, DryRun=dryrun)
+        raise failures[0]
 
 
 def auto_create_bucket(userbucketname: str) -> None:
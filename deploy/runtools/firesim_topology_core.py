@@ -23,6 +23,13 @@ class FireSimTopology(UserTopologies):
 
     This is designed to model tree-like topologies."""
 
+    # memoized dfs orderings. the topology is not modified once constructed,
+    # so these are computed on first use and shared by every pass.
+    _dfs_order: Optional[List[FireSimNode]] = None
+    _dfs_order_switches: Optional[List[FireSimSwitchNode]] = None
+    _dfs_order_servers: Optional[List[FireSimServerNode]] = None
+    _dfs_order_pipes: Optional[List[FireSimPipeNode]] = None
+
     def __init__(self, user_topology_name: str, no_net_num_nodes: int) -> None:
         # This just constructs the user topology. an upper level pass manager
         # will apply passes to it.
@@ -34,36 +41,69 @@ class FireSimTopology(UserTopologies):
         config_func = getattr(self, user_topology_name)
         config_func()
 
+        # in case the user topology walked itself while it was being built
+        self.invalidate_dfs_order()
+
+    def invalidate_dfs_order(self) -> None:
+        """Drop memoized dfs orderings. Must be called if nodes or links
+        are added after construction."""
+        self._dfs_order = None
+        self._dfs_order_switches = None
+        self._dfs_order_servers = None
+        self._dfs_order_pipes = None
+
     def get_dfs_order(self) -> List[FireSimNode]:
-        """Return all nodes in the topology in dfs order, as a list."""
-        stack = list(self.roots)
+        """Return all nodes in the topology in dfs order, as a list.
+
+        The returned list is shared between callers and must not be modified."""
+        if self._dfs_order is None:
+            self._dfs_order = self._compute_dfs_order()
+        return self._dfs_order
+
+    def _compute_dfs_order(self) -> List[FireSimNode]:
+        # iterative post-order walk. the end of the list is the top of the
+        # stack, so children are pushed in reverse to be visited in order.
+        stack = list(reversed(self.roots))
         retlist: List[FireSimNode] = []
         visitedonce = set()
+        emitted = set()
         while stack:
-            nextup = stack[0]
+            nextup = stack[-1]
             if nextup in visitedonce:
-                if nextup not in retlist:
-                    retlist.append(stack.pop(0))
-                else:
-                    stack.pop(0)
+                stack.pop()
+                if nextup not in emitted:
+                    emitted.add(nextup)
+                    retlist.append(nextup)
             else:
                 visitedonce.add(nextup)
-                stack = (
-                    list(map(lambda x: x.get_downlink_side(), nextup.downlinks)) + stack
+                stack.extend(
+                    reversed([x.get_downlink_side() for x in nextup.downlinks])
                 )
         return retlist
 
     def get_dfs_order_switches(self) -> List[FireSimSwitchNode]:
         """Utility function that returns only switches, in dfs order."""
-        return [x for x in self.get_dfs_order() if isinstance(x, FireSimSwitchNode)]
+        if self._dfs_order_switches is None:
+            self._dfs_order_switches = [
+                x for x in self.get_dfs_order() if isinstance(x, FireSimSwitchNode)
+            ]
+        return self._dfs_order_switches
 
     def get_dfs_order_servers(self) -> List[FireSimServerNode]:
         """Utility function that returns only servers, in dfs order."""
-        return [x for x in self.get_dfs_order() if isinstance(x, FireSimServerNode)]
+        if self._dfs_order_servers is None:
+            self._dfs_order_servers = [
+                x for x in self.get_dfs_order() if isinstance(x, FireSimServerNode)
+            ]
+        return self._dfs_order_servers
 
     def get_dfs_order_pipes(self) -> List[FireSimPipeNode]:
         """Utility function that returns only partition hubs, in dfs order."""
-        return [x for x in self.get_dfs_order() if isinstance(x, FireSimPipeNode)]
+        if self._dfs_order_pipes is None:
+            self._dfs_order_pipes = [
+                x for x in self.get_dfs_order() if isinstance(x, FireSimPipeNode)
+            ]
+        return self._dfs_order_pipes
 
     def get_bfs_order(self) -> None:
         """return the nodes in the topology in bfs order"""
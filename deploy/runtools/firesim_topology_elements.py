@@ -425,8 +425,8 @@ class FireSimServerNode(FireSimNode):
         """Mkdir local job results directory and write any pre-sim metadata."""
         job_dir = self.get_local_job_results_dir_path()
         localcap = local("""mkdir -p {}""".format(job_dir), capture=True)
-        rootLogger.debug("[localhost] " + str(localcap))
-        rootLogger.debug("[localhost] " + str(localcap.stderr))
+        rootLogger.debug("[localhost] %s", localcap)
+        rootLogger.debug("[localhost] %s", localcap.stderr)
 
         # add hw config summary per job
         localcap = local(
@@ -435,8 +435,8 @@ class FireSimServerNode(FireSimNode):
             ),
             capture=True,
         )
-        rootLogger.debug("[localhost] " + str(localcap))
-        rootLogger.debug("[localhost] " + str(localcap.stderr))
+        rootLogger.debug("[localhost] %s", localcap)
+        rootLogger.debug("[localhost] %s", localcap.stderr)
 
     def write_script(self, script_name, command) -> str:
         """Write a script named script_name to the local job results dir with
@@ -668,10 +668,7 @@ class FireSimServerNode(FireSimNode):
         """Return True iff any rootfses for this sim require QCOW2 support, as
         determined by their filename ending (.qcow2)."""
         return any(
-            map(
-                lambda x: x is not None and x.endswith(".qcow2"),
-                self.get_all_rootfs_names(),
-            )
+            x is not None and x.endswith(".qcow2") for x in self.get_all_rootfs_names()
         )
 
     def get_bootbin_name(self) -> str:
@@ -715,10 +712,7 @@ class FireSimSuperNodeServerNode(FireSimServerNode):
         siblings = 1
         count = False
         for index, servernode in enumerate(
-            map(
-                lambda x: x.get_downlink_side(),
-                self.uplinks[0].get_uplink_side().downlinks,
-            )
+            x.get_downlink_side() for x in self.uplinks[0].get_uplink_side().downlinks
         ):
             if count:
                 if isinstance(servernode, FireSimDummyServerNode):
@@ -733,10 +727,7 @@ class FireSimSuperNodeServerNode(FireSimServerNode):
         """return the sibling for supernode mode.
         siblingindex = 1 -> next sibling, 2 = second, 3 = last one."""
         for index, servernode in enumerate(
-            map(
-                lambda x: x.get_downlink_side(),
-                self.uplinks[0].get_uplink_side().downlinks,
-            )
+            x.get_downlink_side() for x in self.uplinks[0].get_uplink_side().downlinks
         ):
             if self == servernode:
                 node = (
@@ -961,8 +952,8 @@ class FireSimSwitchNode(FireSimNode):
         job_dir = """{}/switch{}/""".format(job_results_dir, self.switch_id_internal)
 
         localcap = local("""mkdir -p {}""".format(job_dir), capture=True)
-        rootLogger.debug("[localhost] " + str(localcap))
-        rootLogger.debug("[localhost] " + str(localcap.stderr))
+        rootLogger.debug("[localhost] %s", localcap)
+        rootLogger.debug("[localhost] %s", localcap.stderr)
 
         dest_sim_dir = self.get_host_instance().get_sim_dir()
 
@@ -1034,8 +1025,8 @@ class FireSimPipeNode(FireSimNode):
         job_dir = """{}/pipe{}/""".format(job_results_dir, self.pipe_id_internal)
 
         localcap = local("""mkdir -p {}""".format(job_dir), capture=True)
-        rootLogger.debug("[localhost] " + str(localcap))
-        rootLogger.debug("[localhost] " + str(localcap.stderr))
+        rootLogger.debug("[localhost] %s", localcap)
+        rootLogger.debug("[localhost] %s", localcap.stderr)
 
         dest_sim_dir = self.get_host_instance().get_sim_dir()
 
@@ -8,10 +8,15 @@ import pprint
 import logging
 import datetime
 import sys
+import shlex
+import subprocess
 import yaml
+import numpy as np
 from fabric.api import env, parallel, execute, run, local, warn_only  # type: ignore
 from colorama import Fore, Style  # type: ignore
-from functools import reduce
+from itertools import chain
+from operator import methodcaller
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import TemporaryDirectory
 
 from runtools.firesim_topology_elements import (
@@ -32,10 +37,21 @@ from runtools.simulation_data_classes import (
 )
 
 from runtools.run_farm_deploy_managers import InstanceDeployManager
-from typing import Dict, Any, cast, List, Set, TYPE_CHECKING, Callable, Optional
+from typing import (
+    Dict,
+    Any,
+    FrozenSet,
+    cast,
+    List,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Callable,
+    Optional,
+)
 
 if TYPE_CHECKING:
-    from runtools.run_farm import RunFarm
+    from runtools.run_farm import RunFarm, Inst
     from runtools.runtime_config import (
         RuntimeHWDB,
         RuntimeBuildRecipes,
@@ -45,6 +61,36 @@ if TYPE_CHECKING:
 
 rootLogger = logging.getLogger()
 
+# colored True/False strings for the runworkload status display, indexed by bool
+TRUE_FALSE_COLOR = (
+    Fore.YELLOW + "False" + Style.RESET_ALL,
+    Fore.GREEN + "True " + Style.RESET_ALL,
+)
+INVERT_TRUE_FALSE_COLOR = (
+    Fore.GREEN + "False" + Style.RESET_ALL,
+    Fore.YELLOW + "True " + Style.RESET_ALL,
+)
+
+# (node attribute, FireSimTopologyWithPasses default attribute) pairs applied
+# by pass_apply_default_params when the topology leaves the node attribute unset
+_SWITCH_DEFAULTS = (
+    ("switch_link_latency", "defaultlinklatency"),
+    ("switch_switching_latency", "defaultswitchinglatency"),
+    ("switch_bandwidth", "defaultnetbandwidth"),
+)
+_SERVER_DEFAULTS = (
+    ("server_link_latency", "defaultlinklatency"),
+    ("server_bw_max", "defaultnetbandwidth"),
+    ("server_profile_interval", "defaultprofileinterval"),
+    ("tracerv_config", "defaulttracervconfig"),
+    ("autocounter_config", "defaultautocounterconfig"),
+    ("hostdebug_config", "defaulthostdebugconfig"),
+    ("synthprint_config", "defaultsynthprintconfig"),
+    ("plusarg_passthrough", "default_plusarg_passthrough"),
+    ("partition_config", "defaultpartitionconfig"),
+)
+_PIPE_DEFAULTS = (("partition_config", "defaultpartitionconfig"),)
+
 
 @parallel
 def instance_liveness() -> None:
@@ -116,6 +162,8 @@ class FireSimTopologyWithPasses:
     defaultsynthprintconfig: SynthPrintConfig
     defaultpartitionconfig: PartitionConfig
     terminateoncompletion: bool
+    bound_host_nodes: Dict[str, Inst]
+    all_run_farm_ips: Tuple[str, ...]
 
     def __init__(
         self,
@@ -163,6 +211,18 @@ class FireSimTopologyWithPasses:
 
         self.phase_one_passes()
 
+    def bind_run_farm(self, use_mock_instances_for_testing: bool) -> None:
+        """Bind the run farm to its launched hosts, then cache the lookups
+        the fabric fan-outs need: a map of each bound host (as seen in
+        env.host_string) to its Inst, so that @parallel wrappers do a dict
+        lookup instead of scanning the run farm, and the list of hosts to
+        execute on. These stay valid until the run farm is bound again."""
+        self.run_farm.post_launch_binding(use_mock_instances_for_testing)
+        self.bound_host_nodes = {
+            x.get_host(): x for x in self.run_farm.get_all_bound_host_nodes()
+        }
+        self.all_run_farm_ips = tuple(self.bound_host_nodes.keys())
+
     def pass_assign_mac_addresses(self) -> None:
         """DFS through the topology to assign mac addresses"""
         self.passes_used.append("pass_assign_mac_addresses")
@@ -176,12 +236,15 @@ class FireSimTopologyWithPasses:
     def pass_compute_switching_tables(self) -> None:
         """This creates the MAC addr -> port lists for switch nodes.
 
-        a) First, a pass that computes "downlinkmacs" for each node, which
-        represents all of the MAC addresses that are reachable on the downlinks
-        of this switch, to advertise to uplinks.
+        This is a single post-order pass over the topology. For each node it:
 
-        b) Next, a pass that actually constructs the MAC addr -> port lists
-        for switch nodes.
+        a) computes "downlinkmacs", which represents all of the MAC addresses
+        that are reachable on the downlinks of this node, to advertise to
+        uplinks.
+
+        b) if the node is a switch, constructs its MAC addr -> port list. Since
+        the dfs order visits children before parents, the downlinkmacs of every
+        port are already available at this point.
 
         It is assumed that downlinks take ports [0, num downlinks) and
         uplinks take ports [num downlinks, num downlinks + num uplinks)
@@ -194,32 +257,46 @@ class FireSimTopologyWithPasses:
         assert "pass_assign_mac_addresses" in self.passes_used
         self.passes_used.append("pass_compute_switching_tables")
 
+        num_macs = MacAddress.next_mac_to_allocate()
+
         nodes_dfs_order = self.firesimtopol.get_dfs_order()
         for node in nodes_dfs_order:
             if isinstance(node, FireSimServerNode):
                 if node.mac_address_assignable():
                     node.downlinkmacs = [node.get_mac_address()]
-            else:
-                childdownlinkmacs: List[List[MacAddress]] = []
-                for x in node.downlinks:
-                    childdownlinkmacs.append(x.get_downlink_side().downlinkmacs)
-
-                # flatten
-                node.downlinkmacs = reduce(lambda x, y: x + y, childdownlinkmacs)
-
-        switches_dfs_order = self.firesimtopol.get_dfs_order_switches()
+                continue
 
-        for switch in switches_dfs_order:
-            uplinkportno = len(switch.downlinks)
+            # flatten the children's macs in one pass
+            node.downlinkmacs = list(
+                chain.from_iterable(
+                    x.get_downlink_side().downlinkmacs for x in node.downlinks
+                )
+            )
 
-            # prepopulate the table with the last port, which will be
-            switchtab = [uplinkportno for x in range(MacAddress.next_mac_to_allocate())]
-            for port_no in range(len(switch.downlinks)):
-                portmacs = switch.downlinks[port_no].get_downlink_side().downlinkmacs
-                for mac in portmacs:
-                    switchtab[mac.as_int_no_prefix()] = port_no
+            if isinstance(node, FireSimSwitchNode):
+                uplinkportno = len(node.downlinks)
+
+                # prepopulate the table with the last port, which will be
+                # the uplink, then scatter each downlink port over its macs.
+                # downlinkmacs is the concatenation of the ports' macs in port
+                # order, so the whole switch is filled in one call.
+                # the switch models store this table as uint16_t.
+                switchtab = np.full(num_macs, uplinkportno, dtype=np.uint16)
+                port_counts = [
+                    len(x.get_downlink_side().downlinkmacs) for x in node.downlinks
+                ]
+                port_ids = np.repeat(
+                    np.arange(uplinkportno, dtype=np.uint16), port_counts
+                )
+                # read the stored int directly, this is the innermost loop
+                mac_ints = np.fromiter(
+                    (mac.mac_without_prefix_as_int for mac in node.downlinkmacs),
+                    dtype=np.int64,
+                    count=len(node.downlinkmacs),
+                )
+                switchtab[mac_ints] = port_ids
 
-            switch.switch_table = switchtab
+                node.switch_table = switchtab.tolist()
 
     def pass_create_topology_diagram(self) -> None:
         """Produce a PDF that shows a diagram of the network.
@@ -258,18 +335,19 @@ class FireSimTopologyWithPasses:
         # only if we have no networks - pack simulations
         # assumes the user has provided enough or more slots
         servers = self.firesimtopol.get_dfs_order_servers()
+        num_servers = len(servers)
         serverind = 0
 
-        while len(servers) > serverind:
+        while serverind < num_servers:
             # this call will error if no such instances are available.
             instance_handle = self.run_farm.get_smallest_sim_host_handle(num_sims=1)
             allocd_instance = self.run_farm.allocate_sim_host(instance_handle)
 
-            for x in range(allocd_instance.MAX_SIM_SLOTS_ALLOWED):
-                allocd_instance.add_simulation(servers[serverind])
-                serverind += 1
-                if len(servers) == serverind:
-                    return
+            # fill every slot on this host (or place all remaining servers)
+            num_slots = allocd_instance.MAX_SIM_SLOTS_ALLOWED
+            for server in servers[serverind : serverind + num_slots]:
+                allocd_instance.add_simulation(server)
+            serverind += num_slots
 
     def pass_simple_networked_host_node_mapping(self) -> None:
         """A very simple host mapping strategy."""
@@ -279,25 +357,18 @@ class FireSimTopologyWithPasses:
             # Filter out FireSimDummyServerNodes for actually deploying.
             # Infrastructure after this point will automatically look at the
             # FireSimDummyServerNodes if a FireSimSuperNodeServerNode is used
-            alldownlinknodes = list(
-                map(
-                    lambda x: x.get_downlink_side(),
-                    [
-                        downlink
-                        for downlink in switch.downlinks
-                        if not isinstance(
-                            downlink.get_downlink_side(), FireSimDummyServerNode
-                        )
-                    ],
-                )
-            )
-            if all([isinstance(x, FireSimSwitchNode) for x in alldownlinknodes]):
+            alldownlinknodes = [
+                downlink.get_downlink_side()
+                for downlink in switch.downlinks
+                if not isinstance(downlink.get_downlink_side(), FireSimDummyServerNode)
+            ]
+            if all(isinstance(x, FireSimSwitchNode) for x in alldownlinknodes):
                 # all downlinks are switches
                 switch_host_inst_handle = self.run_farm.get_switch_only_host_handle()
                 self.run_farm.allocate_sim_host(switch_host_inst_handle).add_switch(
                     switch
                 )
-            elif all([isinstance(x, FireSimServerNode) for x in alldownlinknodes]):
+            elif all(isinstance(x, FireSimServerNode) for x in alldownlinknodes):
                 downlinknodes = cast(List[FireSimServerNode], alldownlinknodes)
                 # all downlinks are simulations
                 num_downlinks = len(downlinknodes)
@@ -403,19 +474,12 @@ class FireSimTopologyWithPasses:
                 inst.add_simulation(server)
 
         for switch in switches:
-            alldownlinknodes = list(
-                map(
-                    lambda x: x.get_downlink_side(),
-                    [
-                        downlink
-                        for downlink in switch.downlinks
-                        if not isinstance(
-                            downlink.get_downlink_side(), FireSimDummyServerNode
-                        )
-                    ],
-                )
-            )
-            if all([isinstance(x, FireSimSwitchNode) for x in alldownlinknodes]):
+            alldownlinknodes = [
+                downlink.get_downlink_side()
+                for downlink in switch.downlinks
+                if not isinstance(downlink.get_downlink_side(), FireSimDummyServerNode)
+            ]
+            if all(isinstance(x, FireSimSwitchNode) for x in alldownlinknodes):
                 # all downlinks are switches
                 switch_host_inst_handle = self.run_farm.get_switch_only_host_handle()
                 self.run_farm.allocate_sim_host(switch_host_inst_handle).add_switch(
@@ -433,12 +497,20 @@ class FireSimTopologyWithPasses:
         for switch in switches:
             inst = self.run_farm.allocate_sim_host(instance_handle)
             inst.add_switch(switch)
-            alldownlinknodes = map(lambda x: x.get_downlink_side(), switch.downlinks)
-            if all([isinstance(x, FireSimServerNode) for x in alldownlinknodes]):
+            alldownlinknodes = [x.get_downlink_side() for x in switch.downlinks]
+            # classify the downlinks in a single scan
+            has_server = False
+            has_non_server = False
+            for x in alldownlinknodes:
+                if isinstance(x, FireSimServerNode):
+                    has_server = True
+                else:
+                    has_non_server = True
+            if not has_non_server:
                 downlinknodes = cast(List[FireSimServerNode], alldownlinknodes)
                 for server in downlinknodes:
                     inst.add_simulation(server)
-            elif any([isinstance(x, FireSimServerNode) for x in downlinknodes]):
+            elif has_server:
                 assert False, "MIXED DOWNLINKS NOT SUPPORTED."
 
     def pass_perform_host_node_mapping(self) -> None:
@@ -455,24 +527,20 @@ class FireSimTopologyWithPasses:
             special one."""
             # if your roots are servers, just pack as tightly as possible, since
             # you have no_net_config
-            if all([isinstance(x, FireSimServerNode) for x in self.firesimtopol.roots]):
+            if all(isinstance(x, FireSimServerNode) for x in self.firesimtopol.roots):
                 # all roots are servers, so we're in no_net_config
                 # if the user has specified any 16xlarges, we assign to them first
                 self.pass_no_net_host_mapping()
             elif all(
-                [
-                    isinstance(x, FireSimServerNode) or isinstance(x, FireSimSwitchNode)
-                    for x in self.firesimtopol.roots
-                ]
+                isinstance(x, FireSimServerNode) or isinstance(x, FireSimSwitchNode)
+                for x in self.firesimtopol.roots
             ):
                 # now, we're handling the cycle-accurate networked simulation case
                 # currently, we only handle the case where
                 self.pass_simple_networked_host_node_mapping()
             elif all(
-                [
-                    isinstance(x, FireSimServerNode) or isinstance(x, FireSimPipeNode)
-                    for x in self.firesimtopol.roots
-                ]
+                isinstance(x, FireSimServerNode) or isinstance(x, FireSimPipeNode)
+                for x in self.firesimtopol.roots
             ):
                 # now we're handling the cycle-accurate multi-fpga-partitioned simulation case
                 self.pass_simple_partitioned_host_node_mapping()
@@ -504,52 +572,36 @@ class FireSimTopologyWithPasses:
         if self.default_metasim_mode:
             runtimehwconfig_lookup_fn = self.build_recipes.get_runtimehwconfig_from_name
 
+        # most servers share a handful of configs, so resolve each name once.
+        # the default is only looked up if some server actually needs it.
+        resolved_cfgs: Dict[str, RuntimeHWConfig] = {}
+
         for server in servers:
             hw_cfg = server.get_server_hardware_config()
             if hw_cfg is None:
-                hw_cfg = runtimehwconfig_lookup_fn(self.defaulthwconfig)
-            elif isinstance(hw_cfg, str):
-                hw_cfg = runtimehwconfig_lookup_fn(hw_cfg)
+                hw_cfg = self.defaulthwconfig
+            if isinstance(hw_cfg, str):
+                cfg_name = hw_cfg
+                if cfg_name not in resolved_cfgs:
+                    resolved_cfgs[cfg_name] = runtimehwconfig_lookup_fn(cfg_name)
+                hw_cfg = resolved_cfgs[cfg_name]
             rootLogger.debug(f"pass_apply_default_hwconfig, {hw_cfg}")
             server.set_server_hardware_config(hw_cfg)
 
     def pass_apply_default_params(self) -> None:
         """If the user has not set per-node parameters in the topology,
         apply the defaults."""
-        allnodes = self.firesimtopol.get_dfs_order()
-
-        for node in allnodes:
-            if isinstance(node, FireSimSwitchNode):
-                if node.switch_link_latency is None:
-                    node.switch_link_latency = self.defaultlinklatency
-                if node.switch_switching_latency is None:
-                    node.switch_switching_latency = self.defaultswitchinglatency
-                if node.switch_bandwidth is None:
-                    node.switch_bandwidth = self.defaultnetbandwidth
-
-            if isinstance(node, FireSimServerNode):
-                if node.server_link_latency is None:
-                    node.server_link_latency = self.defaultlinklatency
-                if node.server_bw_max is None:
-                    node.server_bw_max = self.defaultnetbandwidth
-                if node.server_profile_interval is None:
-                    node.server_profile_interval = self.defaultprofileinterval
-                if node.tracerv_config is None:
-                    node.tracerv_config = self.defaulttracervconfig
-                if node.autocounter_config is None:
-                    node.autocounter_config = self.defaultautocounterconfig
-                if node.hostdebug_config is None:
-                    node.hostdebug_config = self.defaulthostdebugconfig
-                if node.synthprint_config is None:
-                    node.synthprint_config = self.defaultsynthprintconfig
-                if node.plusarg_passthrough is None:
-                    node.plusarg_passthrough = self.default_plusarg_passthrough
-                if node.partition_config is None:
-                    node.partition_config = self.defaultpartitionconfig
-
-            if isinstance(node, FireSimPipeNode):
-                if node.partition_config is None:
-                    node.partition_config = self.defaultpartitionconfig
+        for nodes, defaults in (
+            (self.firesimtopol.get_dfs_order_switches(), _SWITCH_DEFAULTS),
+            (self.firesimtopol.get_dfs_order_servers(), _SERVER_DEFAULTS),
+            (self.firesimtopol.get_dfs_order_pipes(), _PIPE_DEFAULTS),
+        ):
+            # resolve each default once, not once per node
+            default_values = [(attr, getattr(self, d)) for attr, d in defaults]
+            for node in nodes:
+                for attr, value in default_values:
+                    if getattr(node, attr) is None:
+                        setattr(node, attr, value)
 
     def pass_allocate_nbd_devices(self) -> None:
         """allocate NBD devices. this must be done here to preserve the
@@ -583,8 +635,15 @@ class FireSimTopologyWithPasses:
         repeat the build process more than once per run of the manager."""
 
         def build_drivers_helper(servers: List[FireSimServerNode]) -> None:
+            # many servers share a RuntimeHWConfig, so only visit each once.
+            # the builds themselves stay serial since they run under fabric
+            # prefix() contexts, which modify global fabric state.
+            visited_cfgs: Set[int] = set()
             for server in servers:
                 resolved_cfg = server.get_resolved_server_hardware_config()
+                if id(resolved_cfg) in visited_cfgs:
+                    continue
+                visited_cfgs.add(id(resolved_cfg))
 
                 if resolved_cfg.driver_tar is not None:
                     rootLogger.debug(
@@ -606,8 +665,10 @@ class FireSimTopologyWithPasses:
         # the way the switch models are designed, this requires hosts to be
         # bound to instances.
         switches = self.firesimtopol.get_dfs_order_switches()
-        for switch in switches:
-            switch.build_switch_sim_binary()
+        # every switch is built in its own directory with local() commands, so
+        # the builds are independent and can run concurrently.
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(methodcaller("build_switch_sim_binary"), switches))
 
     # TODO : come up with a better name...
     def pass_build_required_pipes(self) -> None:
@@ -625,18 +686,16 @@ class FireSimTopologyWithPasses:
 
     def infrasetup_passes(self, use_mock_instances_for_testing: bool) -> None:
         """extra passes needed to do infrasetup"""
-        self.run_farm.post_launch_binding(use_mock_instances_for_testing)
+        self.bind_run_farm(use_mock_instances_for_testing)
 
         @parallel
-        def infrasetup_node_wrapper(run_farm: RunFarm, dir: str) -> None:
-            my_node = run_farm.lookup_by_host(env.host_string)
-            assert my_node is not None
+        def infrasetup_node_wrapper(dir: str) -> None:
+            my_node = host_nodes[env.host_string]
             assert my_node.instance_deploy_manager is not None
             my_node.instance_deploy_manager.infrasetup_instance(dir)
 
-        all_run_farm_ips = [
-            x.get_host() for x in self.run_farm.get_all_bound_host_nodes()
-        ]
+        host_nodes = self.bound_host_nodes
+        all_run_farm_ips = self.all_run_farm_ips
         execute(instance_liveness, hosts=all_run_farm_ips)
 
         # Steps occur within the context of a tempdir.
@@ -647,24 +706,20 @@ class FireSimTopologyWithPasses:
             self.pass_build_required_pipes()
             self.pass_build_required_switches()
 
-            execute(
-                infrasetup_node_wrapper, self.run_farm, uridir, hosts=all_run_farm_ips
-            )
+            execute(infrasetup_node_wrapper, uridir, hosts=all_run_farm_ips)
 
     def enumerate_fpgas_passes(self, use_mock_instances_for_testing: bool) -> None:
         """extra passes needed to do enumerate_fpgas"""
-        self.run_farm.post_launch_binding(use_mock_instances_for_testing)
+        self.bind_run_farm(use_mock_instances_for_testing)
 
         @parallel
-        def enumerate_fpgas_node_wrapper(run_farm: RunFarm, dir: str) -> None:
-            my_node = run_farm.lookup_by_host(env.host_string)
-            assert my_node is not None
+        def enumerate_fpgas_node_wrapper(dir: str) -> None:
+            my_node = host_nodes[env.host_string]
             assert my_node.instance_deploy_manager is not None
             my_node.instance_deploy_manager.enumerate_fpgas(dir)
 
-        all_run_farm_ips = [
-            x.get_host() for x in self.run_farm.get_all_bound_host_nodes()
-        ]
+        host_nodes = self.bound_host_nodes
+        all_run_farm_ips = self.all_run_farm_ips
         execute(instance_liveness, hosts=all_run_farm_ips)
 
         # Steps occur within the context of a tempdir.
@@ -674,7 +729,6 @@ class FireSimTopologyWithPasses:
             self.pass_build_required_drivers()
             execute(
                 enumerate_fpgas_node_wrapper,
-                self.run_farm,
                 uridir,
                 hosts=all_run_farm_ips,
             )
@@ -700,12 +754,11 @@ class FireSimTopologyWithPasses:
         (e.g.  incorrect private IPs)
         """
         if not skip_instance_binding:
-            self.run_farm.post_launch_binding(use_mock_instances_for_testing)
+            self.bind_run_farm(use_mock_instances_for_testing)
 
         @parallel
-        def boot_switch_and_pipe_wrapper(run_farm: RunFarm) -> None:
-            my_node = run_farm.lookup_by_host(env.host_string)
-            assert my_node is not None
+        def boot_switch_and_pipe_wrapper() -> None:
+            my_node = host_nodes[env.host_string]
             assert my_node.instance_deploy_manager is not None
             my_node.instance_deploy_manager.start_switches_and_pipes_instance()
 
@@ -714,64 +767,55 @@ class FireSimTopologyWithPasses:
         with TemporaryDirectory() as uridir:
             self.pass_fetch_URI_resolve_runtime_cfg(uridir)
 
-        all_run_farm_ips = [
-            x.get_host() for x in self.run_farm.get_all_bound_host_nodes()
-        ]
+        host_nodes = self.bound_host_nodes
+        all_run_farm_ips = self.all_run_farm_ips
         execute(instance_liveness, hosts=all_run_farm_ips)
-        execute(boot_switch_and_pipe_wrapper, self.run_farm, hosts=all_run_farm_ips)
+        execute(boot_switch_and_pipe_wrapper, hosts=all_run_farm_ips)
 
         @parallel
-        def boot_simulation_wrapper(run_farm: RunFarm) -> None:
-            my_node = run_farm.lookup_by_host(env.host_string)
+        def boot_simulation_wrapper() -> None:
+            my_node = host_nodes[env.host_string]
             assert my_node.instance_deploy_manager is not None
             my_node.instance_deploy_manager.start_simulations_instance()
 
-        execute(boot_simulation_wrapper, self.run_farm, hosts=all_run_farm_ips)
+        execute(boot_simulation_wrapper, hosts=all_run_farm_ips)
 
     def kill_simulation_passes(
         self, use_mock_instances_for_testing: bool, disconnect_all_nbds: bool = True
     ) -> None:
         """Passes that kill the simulator."""
-        self.run_farm.post_launch_binding(use_mock_instances_for_testing)
+        self.bind_run_farm(use_mock_instances_for_testing)
 
         @parallel
-        def kill_switch_wrapper(run_farm: RunFarm) -> None:
-            my_node = run_farm.lookup_by_host(env.host_string)
+        def kill_switch_pipe_and_simulation_wrapper() -> None:
+            """Kill switches, then pipes, then simulations on one host. Unlike
+            boot, teardown needs no barrier between steps across hosts, so do
+            all of them in a single fan-out."""
+            my_node = host_nodes[env.host_string]
             assert my_node.instance_deploy_manager is not None
             my_node.instance_deploy_manager.kill_switches_instance()
-
-        @parallel
-        def kill_simulation_wrapper(run_farm: RunFarm) -> None:
-            my_node = run_farm.lookup_by_host(env.host_string)
-            assert my_node.instance_deploy_manager is not None
+            my_node.instance_deploy_manager.kill_pipes_instance()
             my_node.instance_deploy_manager.kill_simulations_instance(
                 disconnect_all_nbds=disconnect_all_nbds
             )
 
-        @parallel
-        def kill_pipe_wrapper(run_farm: RunFarm) -> None:
-            my_node = run_farm.lookup_by_host(env.host_string)
-            assert my_node.instance_deploy_manager is not None
-            my_node.instance_deploy_manager.kill_pipes_instance()
-
         # Steps occur within the context of a tempdir.
         # This allows URI's to survive until after deploy, and cleanup upon error
         with TemporaryDirectory() as uridir:
             self.pass_fetch_URI_resolve_runtime_cfg(uridir)
 
-        all_run_farm_ips = [
-            x.get_host() for x in self.run_farm.get_all_bound_host_nodes()
-        ]
+        host_nodes = self.bound_host_nodes
+        all_run_farm_ips = self.all_run_farm_ips
 
-        execute(kill_switch_wrapper, self.run_farm, hosts=all_run_farm_ips)
-        execute(kill_pipe_wrapper, self.run_farm, hosts=all_run_farm_ips)
-        execute(kill_simulation_wrapper, self.run_farm, hosts=all_run_farm_ips)
+        execute(kill_switch_pipe_and_simulation_wrapper, hosts=all_run_farm_ips)
 
         def screens() -> None:
             """poll on screens to make sure kill succeeded."""
             with warn_only():
                 rootLogger.info("Confirming exit...")
-                # keep checking screen until it reports that there are no screens left
+                # keep checking screen until it reports that there are no screens left.
+                # back off between polls so slow teardowns don't hammer the host over ssh
+                poll_delay = 1.0
                 while True:
                     run("screen -wipe || true")  # wipe any potentially dead screens
                     screenoutput = run("screen -ls")
@@ -787,14 +831,13 @@ class FireSimTopologyWithPasses:
                     # Previously, it only exited successfully when there was no screen at all. However,
                     # that lead to pathological behaviors when there were other screens running.
                     elif (
-                        ("fsim" in screenoutput)
-                        or ("switch" in screenoutput)
-                        or ("pipe" in screenoutput)
+                        ("fsim" not in screenoutput)
+                        and ("switch" not in screenoutput)
+                        and ("pipe" not in screenoutput)
                     ):
-                        continue
-                    else:
                         break
-                    time.sleep(1)
+                    time.sleep(poll_delay)
+                    poll_delay = min(poll_delay * 1.5, 10.0)
 
         execute(screens, hosts=all_run_farm_ips)
 
@@ -870,11 +913,10 @@ class FireSimTopologyWithPasses:
 
     def run_workload_passes(self, use_mock_instances_for_testing: bool) -> None:
         """extra passes needed to do runworkload."""
-        self.run_farm.post_launch_binding(use_mock_instances_for_testing)
+        self.bind_run_farm(use_mock_instances_for_testing)
 
-        all_run_farm_ips = [
-            x.get_host() for x in self.run_farm.get_all_bound_host_nodes()
-        ]
+        host_nodes = self.bound_host_nodes
+        all_run_farm_ips = self.all_run_farm_ips
 
         rootLogger.info(
             """Creating the directory: {}""".format(self.workload.job_results_dir)
@@ -882,8 +924,8 @@ class FireSimTopologyWithPasses:
         localcap = local(
             """mkdir -p {}""".format(self.workload.job_results_dir), capture=True
         )
-        rootLogger.debug("[localhost] " + str(localcap))
-        rootLogger.debug("[localhost] " + str(localcap.stderr))
+        rootLogger.debug("[localhost] %s", localcap)
+        rootLogger.debug("[localhost] %s", localcap.stderr)
 
         rootLogger.debug(
             """Creating the directory: {}""".format(self.workload.job_monitoring_dir)
@@ -891,8 +933,8 @@ class FireSimTopologyWithPasses:
         localcap = local(
             """mkdir -p {}""".format(self.workload.job_monitoring_dir), capture=True
         )
-        rootLogger.debug("[localhost] " + str(localcap))
-        rootLogger.debug("[localhost] " + str(localcap.stderr))
+        rootLogger.debug("[localhost] %s", localcap)
+        rootLogger.debug("[localhost] %s", localcap.stderr)
 
         # Setup partition configs
         with TemporaryDirectory() as uridir:
@@ -904,23 +946,20 @@ class FireSimTopologyWithPasses:
 
         @parallel
         def monitor_jobs_wrapper(
-            run_farm: RunFarm,
-            prior_completed_jobs: List[str],
-            is_final_loop: bool,
-            is_networked: bool,
-            terminateoncompletion: bool,
-            job_results_dir: str,
+            prior_completed_jobs: FrozenSet[str], is_final_loop: bool
         ) -> Dict[str, Dict[str, bool]]:
             """on each instance, check over its switches and simulations
-            to copy results off."""
-            my_node = run_farm.lookup_by_host(env.host_string)
+            to copy results off. the settings that are fixed for the whole
+            run are taken from the enclosing scope rather than passed
+            through execute() on every poll."""
+            my_node = host_nodes[env.host_string]
             assert my_node.instance_deploy_manager is not None
             return my_node.instance_deploy_manager.monitor_jobs_instance(
                 prior_completed_jobs,
                 is_final_loop,
                 is_networked,
-                terminateoncompletion,
-                job_results_dir,
+                self.terminateoncompletion,
+                self.workload.job_results_dir,
             )
 
         def loop_logger(
@@ -928,57 +967,40 @@ class FireSimTopologyWithPasses:
         ) -> None:
             """Print the simulation status nicely."""
 
-            instancestate_map = dict()
-            if terminateoncompletion:
-                for instip, instdata in instancestates.items():
-                    # if terminateoncompletion and all sims are terminated, the inst must have been terminated
-                    instancestate_map[instip] = all(
-                        [x[1] for x in instdata["sims"].items()]
-                    )
-            else:
-                instancestate_map = {inst: False for inst in instancestates.keys()}
-
+            # collect instance, switch, sim and pipe states in a single pass
+            instancestate_map: Dict[str, bool] = dict()
             switchstates = []
-            for instip, instdata in instancestates.items():
-                for switchname, switchcompleted in instdata["switches"].items():
-                    switchstates.append(
-                        {
-                            "hostip": instip,
-                            "switchname": switchname,
-                            "running": not switchcompleted,
-                        }
-                    )
-
             simstates = []
-            for instip, instdata in instancestates.items():
-                for simname, simcompleted in instdata["sims"].items():
-                    simstates.append(
-                        {
-                            "hostip": instip,
-                            "simname": simname,
-                            "running": not simcompleted,
-                        }
-                    )
-
             pipestates = []
             for instip, instdata in instancestates.items():
-                for pipename, pipecompleted in instdata["pipes"].items():
-                    pipestates.append(
-                        {
-                            "hostip": instip,
-                            "pipename": pipename,
-                            "running": not pipecompleted,
-                        }
-                    )
-
-            truefalsecolor = [
-                Fore.YELLOW + "False" + Style.RESET_ALL,
-                Fore.GREEN + "True " + Style.RESET_ALL,
-            ]
-            inverttruefalsecolor = [
-                Fore.GREEN + "False" + Style.RESET_ALL,
-                Fore.YELLOW + "True " + Style.RESET_ALL,
-            ]
+                # if terminateoncompletion and all sims are terminated, the inst must have been terminated
+                instancestate_map[instip] = terminateoncompletion and all(
+                    instdata["sims"].values()
+                )
+                switchstates += [
+                    {
+                        "hostip": instip,
+                        "switchname": switchname,
+                        "running": not switchcompleted,
+                    }
+                    for switchname, switchcompleted in instdata["switches"].items()
+                ]
+                simstates += [
+                    {
+                        "hostip": instip,
+                        "simname": simname,
+                        "running": not simcompleted,
+                    }
+                    for simname, simcompleted in instdata["sims"].items()
+                ]
+                pipestates += [
+                    {
+                        "hostip": instip,
+                        "pipename": pipename,
+                        "running": not pipecompleted,
+                    }
+                    for pipename, pipecompleted in instdata["pipes"].items()
+                ]
 
             totalsims = len(simstates)
             totalinsts = len(instancestate_map.keys())
@@ -990,87 +1012,79 @@ class FireSimTopologyWithPasses:
             longestpipe = max([len(e["hostip"]) for e in pipestates], default=15)
             longestsim = max([len(e["hostip"]) for e in simstates], default=15)
 
-            # clear the screen
-            rootLogger.info("\033[2J")
-            rootLogger.info(
+            assert isinstance(rootLogger.handlers[0], logging.FileHandler)
+
+            # build the whole report, then emit it as a single log record
+            separator = "-" * 80
+            lines = [
+                # clear the screen
+                "\033[2J",
                 """FireSim Simulation Status @ {}""".format(
-                    str(datetime.datetime.utcnow())
-                )
-            )
-            rootLogger.info("-" * 80)
-            rootLogger.info(
+                    str(datetime.datetime.now(datetime.timezone.utc))
+                ),
+                separator,
                 """This workload's output is located in:\n{}""".format(
                     self.workload.job_results_dir
-                )
-            )
-            assert isinstance(rootLogger.handlers[0], logging.FileHandler)
-            rootLogger.info(
+                ),
                 """This run's log is located in:\n{}""".format(
                     rootLogger.handlers[0].baseFilename
-                )
-            )
-            rootLogger.info("""This status will update every 10s.""")
-            rootLogger.info("-" * 80)
-            rootLogger.info("Instances")
-            rootLogger.info("-" * 80)
+                ),
+                """This status will update at least every 30s.""",
+                separator,
+                "Instances",
+                separator,
+            ]
             for instance in instancestate_map.keys():
-                rootLogger.info(
+                lines.append(
                     """Hostname/IP: {:>{}} | Terminated: {}""".format(
                         instance,
                         longestinst,
-                        truefalsecolor[instancestate_map[instance]],
+                        TRUE_FALSE_COLOR[instancestate_map[instance]],
                     )
                 )
-            rootLogger.info("-" * 80)
-            rootLogger.info("Simulated Switches")
-            rootLogger.info("-" * 80)
+            lines += [separator, "Simulated Switches", separator]
             for switchinfo in switchstates:
-                rootLogger.info(
+                lines.append(
                     """Hostname/IP: {:>{}} | Switch name: {} | Switch running: {}""".format(
                         switchinfo["hostip"],
                         longestswitch,
                         switchinfo["switchname"],
-                        truefalsecolor[switchinfo["running"]],
+                        TRUE_FALSE_COLOR[switchinfo["running"]],
                     )
                 )
-            rootLogger.info("-" * 80)
-            rootLogger.info("Simulated Pipes")
-            rootLogger.info("-" * 80)
+            lines += [separator, "Simulated Pipes", separator]
             for pipeinfo in pipestates:
-                rootLogger.info(
+                lines.append(
                     """Hostname/IP: {:>{}} | Pipe name: {} | Pipe running: {}""".format(
                         pipeinfo["hostip"],
                         longestpipe,
                         pipeinfo["pipename"],
-                        truefalsecolor[pipeinfo["running"]],
+                        TRUE_FALSE_COLOR[pipeinfo["running"]],
                     )
                 )
-            rootLogger.info("-" * 80)
-            rootLogger.info("Simulated Nodes/Jobs")
-            rootLogger.info("-" * 80)
+            lines += [separator, "Simulated Nodes/Jobs", separator]
             for siminfo in simstates:
-                rootLogger.info(
+                lines.append(
                     """Hostname/IP: {:>{}} | Job: {} | Sim running: {}""".format(
                         siminfo["hostip"],
                         longestsim,
                         siminfo["simname"],
-                        inverttruefalsecolor[siminfo["running"]],
+                        INVERT_TRUE_FALSE_COLOR[siminfo["running"]],
                     )
                 )
-            rootLogger.info("-" * 80)
-            rootLogger.info("Summary")
-            rootLogger.info("-" * 80)
-            rootLogger.info(
+            lines += [
+                separator,
+                "Summary",
+                separator,
                 """{}/{} instances are still running.""".format(
                     runninginsts, totalinsts
-                )
-            )
-            rootLogger.info(
+                ),
                 """{}/{} simulations are still running.""".format(
                     runningsims, totalsims
-                )
-            )
-            rootLogger.info("-" * 80)
+                ),
+                separator,
+            ]
+            rootLogger.info("\n".join(lines))
 
         servers = self.firesimtopol.get_dfs_order_servers()
         is_partitioned = False
@@ -1083,31 +1097,51 @@ class FireSimTopologyWithPasses:
             isinstance(self.firesimtopol.roots[0], FireSimSwitchNode) or is_partitioned
         )
 
+        # poll quickly at first and whenever a job finishes, then back off
+        # while nothing is changing
+        poll_delay = 1.0
+        prev_jobs_complete_dict: Dict[str, bool] = {}
+
+        # entries are only ever added to the monitoring dir, one per completed
+        # job, so the last listing stays valid until the dir's mtime moves.
+        jobs_completed_cache: FrozenSet[str] = frozenset()
+        monitoring_dir_mtime_ns: Optional[int] = None
+
+        def get_jobs_completed_local_info() -> FrozenSet[str]:
+            nonlocal jobs_completed_cache, monitoring_dir_mtime_ns
+
+            scan_start_ns = time.time_ns()
+            mtime_ns = os.stat(self.workload.job_monitoring_dir).st_mtime_ns
+            if mtime_ns != monitoring_dir_mtime_ns:
+                # this is the set of jobs completed, since any completed job will
+                # have a directory within this directory. scandir avoids building
+                # an intermediate list before we pull the names out. hosts only
+                # test membership, so hand them a frozenset.
+                with os.scandir(self.workload.job_monitoring_dir) as it:
+                    jobs_completed_cache = frozenset(entry.name for entry in it)
+                # on filesystems with coarse timestamps, a job finishing right
+                # after this scan may not move the mtime. only trust an mtime
+                # that is comfortably older than the scan.
+                if scan_start_ns - mtime_ns > 1_000_000_000:
+                    monitoring_dir_mtime_ns = mtime_ns
+                else:
+                    monitoring_dir_mtime_ns = None
+
+            rootLogger.debug("Monitoring dir jobs completed: %s", jobs_completed_cache)
+            return jobs_completed_cache
+
         # run polling loop
         while True:
             """break out of this loop when either all sims are completed (no
             network) or when one sim is completed (networked case)"""
 
-            def get_jobs_completed_local_info():
-                # this is a list of jobs completed, since any completed job will have
-                # a directory within this directory.
-                monitored_jobs_completed = os.listdir(self.workload.job_monitoring_dir)
-                rootLogger.debug(
-                    f"Monitoring dir jobs completed: {monitored_jobs_completed}"
-                )
-                return monitored_jobs_completed
-
             # return all the state about the instance (potentially copy back results and/or terminate)
             is_final_run = False
             monitored_jobs_completed = get_jobs_completed_local_info()
             instancestates = execute(
                 monitor_jobs_wrapper,
-                self.run_farm,
                 monitored_jobs_completed,
                 is_final_run,
-                is_networked,
-                self.terminateoncompletion,
-                self.workload.job_results_dir,
                 hosts=all_run_farm_ips,
             )
 
@@ -1117,13 +1151,12 @@ class FireSimTopologyWithPasses:
             # log sim state, properly
             loop_logger(instancestates, self.terminateoncompletion)
 
-            jobs_complete_dict = {}
-            simstates = [x["sims"] for x in instancestates.values()]
-            for x in simstates:
-                jobs_complete_dict.update(x)
+            jobs_complete_dict = dict(
+                chain.from_iterable(x["sims"].items() for x in instancestates.values())
+            )
             global_status = jobs_complete_dict.values()
-            rootLogger.debug(f"Jobs complete: {jobs_complete_dict}")
-            rootLogger.debug(f"Global status: {global_status}")
+            rootLogger.debug("Jobs complete: %s", jobs_complete_dict)
+            rootLogger.debug("Global status: %s", global_status)
 
             if is_networked and any(global_status):
                 # at least one simulation has finished
@@ -1140,15 +1173,16 @@ class FireSimTopologyWithPasses:
 
                 rootLogger.debug("One more loop to fully copy results and terminate.")
                 is_final_run = True
-                monitored_jobs_completed = get_jobs_completed_local_info()
+                # the hosts just wrote a monitoring file for every job they
+                # reported as done and killing the sims writes none, so extend
+                # the prior listing instead of re-reading the monitoring dir.
+                monitored_jobs_completed = monitored_jobs_completed.union(
+                    job for job, done in jobs_complete_dict.items() if done
+                )
                 instancestates = execute(
                     monitor_jobs_wrapper,
-                    self.run_farm,
                     monitored_jobs_completed,
                     is_final_run,
-                    is_networked,
-                    self.terminateoncompletion,
-                    self.workload.job_results_dir,
                     hosts=all_run_farm_ips,
                 )
                 break
@@ -1156,21 +1190,29 @@ class FireSimTopologyWithPasses:
             if not is_networked and all(global_status):
                 break
 
-            time.sleep(10)
+            if jobs_complete_dict != prev_jobs_complete_dict:
+                poll_delay = 1.0
+            prev_jobs_complete_dict = jobs_complete_dict
+
+            time.sleep(poll_delay)
+            poll_delay = min(poll_delay * 1.5, 30.0)
 
         # run post-workload hook, if one exists
         if self.workload.post_run_hook is not None:
             rootLogger.info("Running post_run_hook...")
-            localcap = local(
-                """cd {} && {} {}""".format(
-                    self.workload.workload_input_base_dir,
-                    self.workload.post_run_hook,
-                    self.workload.job_results_dir,
-                ),
-                capture=True,
+            # run the hook directly rather than through a shell. the hook may
+            # carry its own arguments, and the results dir is passed last.
+            hookproc = subprocess.run(
+                shlex.split(self.workload.post_run_hook)
+                + [self.workload.job_results_dir],
+                cwd=self.workload.workload_input_base_dir,
+                capture_output=True,
+                text=True,
+                check=False,
             )
-            rootLogger.debug("[localhost] " + str(localcap))
-            rootLogger.debug("[localhost] " + str(localcap.stderr))
+            rootLogger.debug("[localhost] %s", hookproc.stdout)
+            rootLogger.debug("[localhost] %s", hookproc.stderr)
+            hookproc.check_returncode()
 
         rootLogger.info(
             "FireSim Simulation Exited Successfully. See results in:\n"
@@ -1178,7 +1220,7 @@ class FireSimTopologyWithPasses:
         )
 
 
-if __name__ == "__main__":
+if __name__ == "__main__" and "--run-doctests" in sys.argv:
     import doctest
 
     doctest.testmod()
@@ -189,6 +189,7 @@ class RunFarm(metaclass=abc.ABCMeta):
 
         SORTED_SIM_HOST_HANDLE_TO_MAX_FPGA_SLOTS: sorted 'SIM_HOST_HANDLE_TO_MAX_FPGA_SLOTS' by FPGAs available
         SORTED_SIM_HOST_HANDLE_TO_MAX_METASIM_SLOTS: sorted 'SIM_HOST_HANDLE_TO_MAX_METASIM_SLOTS' by metasim slots available
+        SORTED_SWITCH_ONLY_OK_SIM_HOST_HANDLES: sorted host handles from 'SIM_HOST_HANDLE_TO_SWITCH_ONLY_OK' that allow switch-only use
 
         run_farm_hosts_dict: list of instances requested (Inst object and one of [None, boto3 object, mock boto3 object, other cloud-specific obj]). TODO: improve this later
         mapper_consumed: dict of allocated instance names to number of allocations of that instance name.
@@ -204,6 +205,7 @@ class RunFarm(metaclass=abc.ABCMeta):
 
     SORTED_SIM_HOST_HANDLE_TO_MAX_FPGA_SLOTS: List[Tuple[int, str]]
     SORTED_SIM_HOST_HANDLE_TO_MAX_METASIM_SLOTS: List[Tuple[int, str]]
+    SORTED_SWITCH_ONLY_OK_SIM_HOST_HANDLES: List[str]
 
     run_farm_hosts_dict: Dict[
         str, List[Tuple[Inst, Optional[Union[EC2InstanceResource, MockBoto3Instance]]]]
@@ -230,6 +232,11 @@ class RunFarm(metaclass=abc.ABCMeta):
         self.SORTED_SIM_HOST_HANDLE_TO_MAX_METASIM_SLOTS = invert_filter_sort(
             self.SIM_HOST_HANDLE_TO_MAX_METASIM_SLOTS
         )
+        self.SORTED_SWITCH_ONLY_OK_SIM_HOST_HANDLES = sorted(
+            sim_host_handle
+            for sim_host_handle, switch_ok in self.SIM_HOST_HANDLE_TO_SWITCH_ONLY_OK.items()
+            if switch_ok
+        )
 
     def get_smallest_sim_host_handle(self, num_sims: int) -> str:
         """Return the smallest run host handle (unique string to identify a run host type) that
@@ -272,13 +279,7 @@ class RunFarm(metaclass=abc.ABCMeta):
         """Get the default run host handle (unique string to identify a run host type) that can
         host switch simulations.
         """
-        for sim_host_handle, switch_ok in sorted(
-            self.SIM_HOST_HANDLE_TO_SWITCH_ONLY_OK.items(), key=lambda x: x[0]
-        ):
-            if not switch_ok:
-                # cannot use this handle for switch-only mapping
-                continue
-
+        for sim_host_handle in self.SORTED_SWITCH_ONLY_OK_SIM_HOST_HANDLES:
             num_consumed = self.mapper_consumed[sim_host_handle]
             num_allocated = len(self.run_farm_hosts_dict[sim_host_handle])
             if num_consumed >= num_allocated:
@@ -327,11 +328,6 @@ class RunFarm(metaclass=abc.ABCMeta):
         """Return all run host nodes that are ready to use (bound to relevant objects)."""
         raise NotImplementedError
 
-    @abc.abstractmethod
-    def lookup_by_host(self, host: str) -> Inst:
-        """Return run farm host based on host."""
-        raise NotImplementedError
-
     @abc.abstractmethod
     def terminate_by_inst(self, inst: Inst) -> None:
         """Terminate run farm host based on Inst object."""
@@ -636,9 +632,15 @@ class AWSEC2F1(RunFarm):
             userconfirm = "yes"
 
         if userconfirm == "yes":
-            for sim_host_handle in sorted(self.SIM_HOST_HANDLE_TO_MAX_FPGA_SLOTS):
-                if len(all_instance_ids[sim_host_handle]) != 0:
-                    terminate_instances(all_instance_ids[sim_host_handle], False)
+            # issue a single batched request for every handle instead of one
+            # EC2 API call per instance handle
+            instance_ids_to_terminate = [
+                instance_id
+                for sim_host_handle in sorted(self.SIM_HOST_HANDLE_TO_MAX_FPGA_SLOTS)
+                for instance_id in all_instance_ids[sim_host_handle]
+            ]
+            if len(instance_ids_to_terminate) != 0:
+                terminate_instances(instance_ids_to_terminate, False)
             rootLogger.critical(
                 "Instances terminated. Please confirm in your AWS Management Console."
             )
@@ -662,12 +664,6 @@ class AWSEC2F1(RunFarm):
                     all_insts.append(inst)
         return all_insts
 
-    def lookup_by_host(self, host) -> Inst:
-        for host_node in self.get_all_bound_host_nodes():
-            if host_node.get_host() == host:
-                return host_node
-        assert False, f"Unable to find host node by {host}"
-
     def terminate_by_inst(self, inst: Inst) -> None:
         """Terminate run farm host based on host."""
         for sim_host_handle in sorted(self.SIM_HOST_HANDLE_TO_MAX_FPGA_SLOTS):
@@ -793,12 +789,6 @@ class ExternallyProvisioned(RunFarm):
     def get_all_bound_host_nodes(self) -> List[Inst]:
         return self.get_all_host_nodes()
 
-    def lookup_by_host(self, host: str) -> Inst:
-        for host_node in self.get_all_bound_host_nodes():
-            if host_node.get_host() == host:
-                return host_node
-        assert False, f"Unable to find host node by {host} host name"
-
     def terminate_by_inst(self, inst: Inst) -> None:
         rootLogger.info(
             f"WARNING: Skipping terminate_by_inst since run hosts are externally provisioned."
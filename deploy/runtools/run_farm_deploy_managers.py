@@ -17,7 +17,7 @@ from awstools.awstools import terminate_instances, get_instance_ids_for_instance
 from runtools.utils import has_sudo, run_only_aws, check_script, is_on_aws, script_path
 from buildtools.bitbuilder import get_deploy_dir
 
-from typing import List, Dict, Optional, Union, Tuple, TYPE_CHECKING
+from typing import List, Dict, FrozenSet, Optional, Union, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from runtools.run_farm import Inst
@@ -481,7 +481,7 @@ class InstanceDeployManager(metaclass=abc.ABCMeta):
 
     def monitor_jobs_instance(
         self,
-        prior_completed_jobs: List[str],
+        prior_completed_jobs: FrozenSet[str],
         is_final_loop: bool,
         is_networked: bool,
         terminateoncompletion: bool,
@@ -557,9 +557,7 @@ class InstanceDeployManager(metaclass=abc.ABCMeta):
 
             sim_slots = self.parent_node.sim_slots
             jobnames = [slot.get_job_name() for slot in sim_slots]
-            all_jobs_completed = all(
-                [(job in prior_completed_jobs) for job in jobnames]
-            )
+            all_jobs_completed = all(job in prior_completed_jobs for job in jobnames)
 
             self.instance_logger(f"jobnames: {jobnames}", debug=True)
             self.instance_logger(
@@ -605,15 +603,13 @@ class InstanceDeployManager(metaclass=abc.ABCMeta):
                         pipescompleteddict[pipename] = True
 
             # fill in whether sims have terminated
-            completed_jobs = (
-                prior_completed_jobs.copy()
-            )  # create local copy to append to
+            completed_jobs = set(prior_completed_jobs)  # create local copy to add to
             for slotno, jobname in enumerate(jobnames):
                 if (str(slotno) not in slotsrunning) and (
                     jobname not in completed_jobs
                 ):
                     self.instance_logger(f"Slot {slotno}, Job {jobname} completed!")
-                    completed_jobs.append(jobname)
+                    completed_jobs.add(jobname)
 
                     # this writes the job monitoring file
                     sim_slots[slotno].copy_back_job_results_from_run(slotno)
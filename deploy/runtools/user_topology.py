@@ -126,7 +126,7 @@ class UserTopologies:
         for switchno in range(len(coreswitches)):
             core = coreswitches[switchno]
             base = 0 if switchno < 2 else 1
-            dls = list(map(lambda x: aggrswitches[x], range(base, 8, 2)))
+            dls = [aggrswitches[x] for x in range(base, 8, 2)]
             core.add_downlinks(dls)
         for switchbaseno in range(0, len(aggrswitches), 2):
             switchno = switchbaseno + 0